@@ -1,76 +1,360 @@
 import requests
-import xml.etree.ElementTree as ET
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import random
 import json
+import logging
 import os
 import csv
+import functools
+from urllib.parse import quote_plus
+import sqlite3
+from collections import Counter, defaultdict
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+try:
+    from lxml import etree as ET  # C-backed libxml2 parser, API-compatible for what we use
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+logger = logging.getLogger(__name__)
 
 # ---------------------------- Utility Functions ----------------------------
 
 def ensure_directory(path):
     """Ensure a directory exists."""
-    if not os.path.exists(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
 
 
 def load_cache(file_path):
     """Load cache from a file."""
-    if os.path.exists(file_path):
-        with open(file_path, 'r') as f:
-            return json.load(f)
-    return {}
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return {}
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def cache_age(file_path):
+    """Seconds since a cache file was last written, or None if it does not exist."""
+    try:
+        return time.time() - os.path.getmtime(file_path)
+    except FileNotFoundError:
+        return None
 
 
 def save_cache(data, file_path):
-    """Save cache to a file."""
+    """Save a machine-read cache to a file. With orjson installed it is indented by 2 spaces, the only width it supports."""
+    if orjson:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(file_path, 'w') as f:
+        json.dump(data, f, indent=4)
+
+
+def save_output(data, file_path):
+    """Save a user-facing JSON file, formatted the same whether or not orjson is installed."""
     with open(file_path, 'w') as f:
         json.dump(data, f, indent=4)
 
 
+class AuthorStore:
+    """SQLite-backed cache of author profiles, one row per author instead of one file per author."""
+
+    FIELDS = {
+        'profile_url': 'TEXT',
+        'pub_count': 'INTEGER',
+        'affiliation': 'TEXT',
+        'is_professor': 'INTEGER',
+        'checked_at': 'REAL',
+    }
+
+    # Stay well below SQLite's limit on bound parameters per statement
+    BATCH_SIZE = 500
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        columns = ', '.join(f"{field} {sql_type}" for field, sql_type in self.FIELDS.items())
+        self.conn.execute(f"CREATE TABLE IF NOT EXISTS authors (name TEXT PRIMARY KEY, {columns})")
+        
+        # Add columns introduced after the database was created
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(authors)")}
+        for field, sql_type in self.FIELDS.items():
+            if field not in existing:
+                self.conn.execute(f"ALTER TABLE authors ADD COLUMN {field} {sql_type}")
+
+    def get_many(self, names):
+        """Return the cache entries of all given authors that have been looked up, keyed by name."""
+        names = list(names)
+        author_caches = {}
+        for start in range(0, len(names), self.BATCH_SIZE):
+            batch = names[start:start + self.BATCH_SIZE]
+            rows = self.conn.execute(
+                f"SELECT name, {', '.join(self.FIELDS)} FROM authors "
+                f"WHERE name IN ({', '.join('?' * len(batch))})",
+                batch,
+            )
+            for name, *values in rows:
+                author_caches[name] = self._to_cache(values)
+        return author_caches
+
+    def _to_cache(self, values):
+        # A NULL profile_url is meaningful (no DBLP profile), the other columns are only set once fetched
+        author_cache = {'profile_url': values[0]}
+        author_cache.update((field, value) for field, value in zip(list(self.FIELDS)[1:], values[1:]) if value is not None)
+        if 'is_professor' in author_cache:
+            author_cache['is_professor'] = bool(author_cache['is_professor'])
+        return author_cache
+
+    def upsert(self, name, **fields):
+        """Insert or update the given fields of an author's entry. Call commit() to persist."""
+        unknown = set(fields) - set(self.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown author fields: {sorted(unknown)}")
+        columns = ', '.join(fields)
+        placeholders = ', '.join('?' * len(fields))
+        updates = ', '.join(f"{column} = excluded.{column}" for column in fields)
+        self.conn.execute(
+            f"INSERT INTO authors (name, {columns}) VALUES (?, {placeholders}) "
+            f"ON CONFLICT(name) DO UPDATE SET {updates}",
+            (name, *fields.values()),
+        )
+
+    def commit(self):
+        self.conn.commit()
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: allows `rate` requests per `per` seconds, with bursts of up to `rate`.
+
+    The rate adapts to the server: it halves (down to `min_rate`) whenever we get rate limited,
+    and recovers a tenth of the configured rate per `recovery_window` seconds without being limited.
+    """
+
+    def __init__(self, rate, per=1.0, min_rate=0.1, recovery_window=10.0):
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.rate = rate
+        self.per = per
+        self.recovery_window = recovery_window
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.recovered_at = self.updated
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(max(self.rate, 1), self.tokens + (now - self.updated) * self.rate / self.per)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) * self.per / self.rate
+            time.sleep(wait)
+
+    def rate_limited(self):
+        """Back off after the server rejected a request as too frequent."""
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = 0
+            self.recovered_at = time.monotonic()
+
+    def succeeded(self):
+        """Recover some of the configured rate once a recovery window passed without being rate limited."""
+        with self.lock:
+            now = time.monotonic()
+            if now - self.recovered_at >= self.recovery_window:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+                self.recovered_at = now
+
+
+@functools.lru_cache(maxsize=None)
+def author_cache_path(author):
+    """Legacy per-author cache file path (memoized, since the same authors recur across papers)."""
+    return f"cache/authors/{author.replace(' ', '_')}.json"
+
+
+def load_author_index(authors):
+    """
+    Load each author's cache once, keyed by author name.
+
+    Authors missing from the store fall back to the per-author files under
+    cache/authors/ written by earlier runs, and are copied into the store so
+    each legacy file is read at most once.
+    """
+    authors = set(authors)
+    known = AUTHOR_STORE.get_many(authors)
+    author_index = {}
+    for author in authors:
+        author_cache = known.get(author)
+        if author_cache is None:
+            author_cache = load_cache(author_cache_path(author))
+            if author_cache:
+                # Date legacy entries by their file, so they don't all count as expired at once
+                author_cache = {'checked_at': os.path.getmtime(author_cache_path(author)), **author_cache}
+                AUTHOR_STORE.upsert(author, **author_cache)
+        author_index[author] = author_cache
+    AUTHOR_STORE.commit()
+    return author_index
+
+
 # Initialize Cache Directories
 ensure_directory('cache/conferences')
-ensure_directory('cache/authors')
+
+# All author profiles live in one SQLite database, committed once per batch instead of once per author
+AUTHOR_STORE = AuthorStore('cache/authors.db')
+AUTHOR_CACHE_COMMIT_INTERVAL = 100
+
+# Number of DBLP requests allowed in flight at once, so the server isn't hammered.
+MAX_WORKERS = 5
+
+# Shared HTTP session: keeps connections to DBLP alive instead of a new TLS handshake per request.
+# The adapter retries connection errors and 5xx; 429s are handled by _get_with_backoff.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504]),
+))
+# Identify the crawler to DBLP instead of sending the generic python-requests agent
+SESSION.headers.update({"User-Agent": "quantum-cs-data-collecter (+https://github.com/Hanrui-Wang/quantum-cs-data-collecter)"})
+MAX_RATE_LIMIT_ATTEMPTS = 6
+
+DBLP_PUBL_SEARCH_URL = "https://dblp.org/search/publ/api"
+DBLP_AUTHOR_SEARCH_URL = "https://dblp.org/search/author/api"
+
+# Element paths and tags read from DBLP responses (valid for both lxml and the stdlib parser)
+DBLP_HIT_TAG = "hit"
+DBLP_INFO_PATH = "info"
+DBLP_AUTHOR_PATH = ".//author"
+DBLP_PROFILE_URL_PATH = ".//hits/hit/info/url"
+DBLP_PID_URL = "https://dblp.org/pid/{pid}"
+DBLP_PROFILE_ROOT_TAG = "dblpperson"
+DBLP_PERSON_TAG = "person"
+DBLP_RECORD_TAG = "r"
+DBLP_NOTE_TAG = "note"
+
+# Authors with at least this many DBLP publications are treated as professors
+PROFESSOR_PUB_THRESHOLD = 20
+
+# Conference listings are re-fetched once this old, so late-indexed papers are picked up
+CONFERENCE_CACHE_TTL = 30 * 86400
+
+# Authors DBLP had no profile for are searched again once this old, in case they have one by now
+NEGATIVE_CACHE_TTL = 7 * 86400
+# Non-professors are re-checked once this old, since publication counts only grow
+PROFILE_CACHE_TTL = 7 * 86400
+
+# Unread profile bodies up to this size are drained after an early stop so the keep-alive
+# connection can be reused; larger ones are cheaper to drop than to download
+DRAIN_MAX_BYTES = 1024 * 1024
+
+# DBLP asks crawlers for about one request per second; shared by every thread that talks to it
+DBLP_RATE_LIMITER = RateLimiter(rate=1, per=1.0)
+
+
+def _get_with_backoff(url, stream=False):
+    """GET a URL, backing off exponentially (or per Retry-After) while DBLP rate limits us."""
+    for attempt in range(MAX_RATE_LIMIT_ATTEMPTS):
+        DBLP_RATE_LIMITER.acquire()
+        response = SESSION.get(url, stream=stream)
+        if response.status_code != 429:
+            DBLP_RATE_LIMITER.succeeded()
+            return response
+        response.close()
+        DBLP_RATE_LIMITER.rate_limited()
+        
+        retry_after = response.headers.get("Retry-After", "")
+        delay = int(retry_after) if retry_after.isdigit() else min(2 ** attempt, 30)
+        delay += random.random()
+        logger.warning("Rate limited. Sleeping %.1fs before retry...", delay)
+        time.sleep(delay)
+    raise Exception(f"Still rate limited after {MAX_RATE_LIMIT_ATTEMPTS} attempts: {url}")
+
+
+def _release_connection(response):
+    """Drain the unread rest of a streamed response so its connection goes back to the pool."""
+    length = response.headers.get("Content-Length", "")
+    if not length.isdigit() or int(length) <= DRAIN_MAX_BYTES:
+        response.raw.drain_conn()
 
 
 # ---------------------------- Stage 1: Fetch Conference Data ----------------------------
 
 def query_dblp(keyword, venue, year, max_results=50):
     """Fetch papers from DBLP and cache results."""
-    cache_path = f"cache/conferences/{venue}{year}.json"
-    conference_cache = load_cache(cache_path)
+    cache_path = f"cache/conferences/{venue}{year}_{keyword}.json"
+    age = cache_age(cache_path)
+    conference_cache = load_cache(cache_path) if age is not None and age < CONFERENCE_CACHE_TTL else None
     
     if conference_cache:
-        print(f"Loading cached data for {venue} {year}...")
-        return False, conference_cache
+        logger.debug("Loading cached data for %s %s...", venue, year)
+        return conference_cache
 
-    base_url = "https://dblp.org/search/publ/api"
-    params = {"q": f"title:{keyword} venue:{venue} year:{year}", "format": "xml", "h": max_results}
+    query = quote_plus(f"title:{keyword} venue:{venue} year:{year}")
+    url = f"{DBLP_PUBL_SEARCH_URL}?q={query}&format=xml&h={max_results}"
 
     try:
-        response = requests.get(base_url, params=params)
-        if response.status_code == 429:
-            print("Rate limited. Sleeping before retry...")
-            time.sleep(random.uniform(60, 120))
-            return query_dblp(keyword, venue, year, max_results)
-        if response.status_code != 200:
-            raise Exception(f"Failed to fetch data: {response.status_code}")
-        
-        root = ET.fromstring(response.content)
-        papers = [{"title": info.find("title").text, "authors": [a.text for a in info.findall(".//author")]} 
-                  for info in root.findall(".//info")]
+        with _get_with_backoff(url, stream=True) as response:
+            if response.status_code != 200:
+                raise Exception(f"Failed to fetch data: {response.status_code}")
+            response.raw.decode_content = True
+            
+            # Parse hit by hit straight off the socket, freeing each one once read
+            papers = []
+            for _, hit in ET.iterparse(response.raw, events=('end',)):
+                if hit.tag != DBLP_HIT_TAG:
+                    continue
+                info = hit.find(DBLP_INFO_PATH)
+                authors = list(info.iterfind(DBLP_AUTHOR_PATH))
+                papers.append({
+                    "title": info.findtext("title"),
+                    "authors": [a.text for a in authors],
+                    # DBLP PIDs identify each author's profile directly, saving a name search per author
+                    "author_pids": {a.text: a.get("pid") for a in authors if a.get("pid")},
+                })
+                hit.clear()
         
         save_cache(papers, cache_path)
-        return True, papers
+        return papers
     except Exception as e:
-        print(f"Error querying DBLP: {e}")
-    return False, []
+        logger.error("Error querying DBLP: %s", e)
+    return []
+
+
+def _query_conference(keyword, venue, year):
+    """Query one venue/year and tag each paper with where it was published."""
+    logger.info("Querying %s %s...", venue, year)
+    papers = query_dblp(keyword, venue, year)
+    
+    # Add venue and year to each paper (copies, since cached papers are shared)
+    return [{**paper, 'venue': venue, 'year': year, 'conference': f"{venue}{year}"} for paper in papers]
 
 
-def fetch_all_conference_papers():
+def fetch_all_conference_papers(on_papers=None):
     """
     Fetch papers from multiple conferences and years, adding venue and year to each paper entry.
     
+    Args:
+        on_papers (Callable[[List[Dict]], None], optional): Called on this thread with each venue/year's
+                                                            papers as soon as they arrive, so downstream
+                                                            work can overlap the remaining queries.
+    
     Returns:
         List[Dict]: A list of paper dictionaries with 'title', 'authors', 'conference', 'venue', and 'year'.
     """
@@ -79,21 +363,14 @@ def fetch_all_conference_papers():
     years = range(2020, 2025)
     all_papers = []
 
-    for venue in venues:
-        for year in years:
-            print(f"Querying {venue} {year}...")
-            is_sleep, papers = query_dblp(keyword, venue, year)
-            
-            # Add venue and year to each paper
-            for paper in papers:
-                paper['venue'] = venue
-                paper['year'] = year
-                paper['conference'] = f"{venue}{year}"
-            
-            all_papers.extend(papers)
-            
-            if is_sleep:
-                time.sleep(random.uniform(2, 5))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(_query_conference, keyword, venue, year) for venue in venues for year in years]
+        if on_papers is not None:
+            for future in as_completed(futures):
+                on_papers(future.result())
+        # Collect in submission order, so the output matches the serial version
+        for future in futures:
+            all_papers.extend(future.result())
     
     save_cache(all_papers, 'cache/all_papers.json')
     return all_papers
@@ -102,168 +379,248 @@ def fetch_all_conference_papers():
 
 # ---------------------------- Stage 2: Process and Cache Author Profiles ----------------------------
 
-def get_dblp_author_profile(author_name):
-    """Fetch DBLP profile URL for an author."""
-    author_cache_path = f"cache/authors/{author_name.replace(' ', '_')}.json"
-    author_cache = load_cache(author_cache_path)
+@functools.lru_cache(maxsize=None)
+def _search_dblp_author(author_name):
+    """Resolve an author name to a DBLP profile URL, or None if DBLP has no match. Memoized, misses included."""
+    response = _get_with_backoff(f"{DBLP_AUTHOR_SEARCH_URL}?q={quote_plus(author_name)}&format=xml&h=1")
+    if response.status_code != 200:
+        raise Exception(f"Failed to query DBLP: Status Code {response.status_code}")
     
+    # Parse the XML response
+    root = ET.fromstring(response.content)
+    author_entry = root.find(DBLP_PROFILE_URL_PATH)
+    return author_entry.text if author_entry is not None else None
+
+
+def _is_fresh_miss(author_cache):
+    """Whether DBLP recently had no profile for this author, so searching again is pointless."""
+    return ('profile_url' in author_cache and author_cache['profile_url'] is None
+            and time.time() - author_cache.get('checked_at', 0) < NEGATIVE_CACHE_TTL)
+
+
+def _needs_lookup(author_cache):
+    """Whether an author has to be (re)checked on DBLP."""
+    if author_cache.get('is_professor'):
+        return False
+    if 'is_professor' in author_cache:
+        return time.time() - author_cache.get('checked_at', 0) >= PROFILE_CACHE_TTL
+    return not _is_fresh_miss(author_cache)
+
+
+def get_dblp_author_profile(author_name, author_cache):
+    """Fetch DBLP profile URL for an author, recording it in their cache entry."""
     # Return cached profile URL if available
-    if 'profile_url' in author_cache:
+    if author_cache.get('profile_url') or _is_fresh_miss(author_cache):
         return author_cache['profile_url']
-    
-    search_url = "https://dblp.org/search/author/api"
-    params = {"q": author_name, "format": "xml", "h": 1}
 
     try:
-        response = requests.get(search_url, params=params)  # Pass params here
-        if response.status_code == 429:
-            print("Rate limited. Sleeping before retry...")
-            time.sleep(random.uniform(60, 120))
-            return get_dblp_author_profile(author_name)
-        if response.status_code != 200:
-            raise Exception(f"Failed to query DBLP: Status Code {response.status_code}")
-        
-        # Parse the XML response
-        root = ET.fromstring(response.content)
-        author_entry = root.find(".//hits/hit/info/url")
-        profile_url = author_entry.text if author_entry is not None else None
-        
-        # Cache the profile URL
-        author_cache['profile_url'] = profile_url
-        save_cache(author_cache, author_cache_path)
-        
-        return profile_url
+        profile_url = _search_dblp_author(author_name)
     except Exception as e:
-        print(f"Error fetching DBLP author profile: {e}")
-    return None
+        logger.warning("Error fetching DBLP author profile: %s", e)
+        return None
+    
+    # Cache the profile URL, timestamped so misses can expire
+    author_cache['profile_url'] = profile_url
+    author_cache['checked_at'] = time.time()
+    return profile_url
 
 
+def fetch_author_profile(author_url, threshold=None):
+    """
+    Fetch publication count and latest affiliation from a single download of a DBLP author profile.
 
-def get_dblp_publication_count(author_url):
-    """Fetch publication count from DBLP author profile."""
+    DBLP states the publication count on the profile's root element, so normally only the
+    <person> header is read. If the count is missing, records are counted instead; with a
+    threshold, counting stops once that many are seen and the count returned is a lower
+    bound, which is all a threshold test needs.
+    """
     try:
-        response = requests.get(author_url + ".xml")
-        root = ET.fromstring(response.content)
-        return len(root.findall(".//r"))
+        with _get_with_backoff(author_url + ".xml", stream=True) as response:
+            if response.status_code != 200:
+                raise Exception(f"Failed to fetch profile: Status Code {response.status_code}")
+            response.raw.decode_content = True
+            
+            # Stream-parse so memory stays flat however many publications the author has
+            pub_count, stated_count, affiliation = 0, None, None
+            stopped_early = False
+            for event, elem in ET.iterparse(response.raw, events=('start', 'end')):
+                if event == 'start':
+                    if elem.tag == DBLP_PROFILE_ROOT_TAG and elem.get('n', '').isdigit():
+                        stated_count = int(elem.get('n'))
+                    continue
+                if elem.tag == DBLP_NOTE_TAG and affiliation is None and elem.get('type') == 'affiliation':
+                    affiliation = (elem.text or '').strip()
+                elif elem.tag == DBLP_PERSON_TAG and stated_count is not None:
+                    # Affiliation notes live in <person>; with the count already known we are done
+                    stopped_early = True
+                    break
+                elif elem.tag == DBLP_RECORD_TAG:
+                    pub_count += 1
+                    elem.clear()
+                    # The affiliation note precedes the records, so nothing is missed by stopping here
+                    if threshold is not None and pub_count >= threshold:
+                        stopped_early = True
+                        break
+            if stopped_early:
+                _release_connection(response)
+        return (stated_count if stated_count is not None else pub_count), affiliation or "Unknown Affiliation"
     except Exception as e:
-        print(f"Error fetching publication count: {e}")
-    return None
+        logger.warning("Error fetching author profile: %s", e)
+    return None, "Unknown Affiliation"
+
+
+def _process_author(author, author_cache, pid=None):
+    """Look up one author on DBLP and return their updated cache entry."""
+    author_cache = dict(author_cache)
+    if pid:
+        # A paper record names the author's exact profile; trust it over a name search, cached or not
+        author_cache.update(profile_url=DBLP_PID_URL.format(pid=pid), checked_at=time.time())
+    profile_url = get_dblp_author_profile(author, author_cache)
+    if not profile_url:
+        return author_cache
+
+    pub_count, latest_affiliation = fetch_author_profile(profile_url, threshold=PROFESSOR_PUB_THRESHOLD)
+    if pub_count is None:
+        return author_cache
+    
+    affiliation = "Unknown"
+    if pub_count >= PROFESSOR_PUB_THRESHOLD:
+        affiliation = latest_affiliation
+    
+    author_cache.update({
+        'profile_url': profile_url,
+        'pub_count': pub_count,
+        'affiliation': affiliation,
+        'is_professor': pub_count >= PROFESSOR_PUB_THRESHOLD,
+        'checked_at': time.time(),
+    })
+    return author_cache
 
 
-def get_latest_affiliation(author_url):
-    """Fetch latest affiliation from DBLP author profile."""
-    try:
-        response = requests.get(author_url + ".xml")
-        root = ET.fromstring(response.content)
-        affiliation = root.find(".//note[@type='affiliation']")
-        return affiliation.text.strip() if affiliation is not None else "Unknown Affiliation"
-    except Exception as e:
-        print(f"Error fetching affiliation: {e}")
-    return "Unknown Affiliation"
+class AuthorLookups:
+    """
+    Looks up authors on DBLP in the background as batches of papers arrive.
 
+    Lookups run on a thread pool; wait() writes their results to the author store
+    on the calling thread, which owns the store's connection.
+    """
 
-def process_all_authors(papers):
-    """Process unique authors and cache their publication count and affiliation."""
-    authors = set(author for paper in papers for author in paper['authors'])
-    print(f"Found {len(authors)} unique authors.")
-    
-    for idx, author in enumerate(authors, start=1):
-        print(f"Processing author {author} ({idx}/{len(authors)})")
-        author_cache_path = f"cache/authors/{author.replace(' ', '_')}.json"
-        author_cache = load_cache(author_cache_path)
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        self.futures = {}
+        self.author_index = {}
+        self.author_pids = {}
+
+    def submit_papers(self, papers):
+        """Start looking up the authors of these papers that need it."""
+        new_pids = {author: pid for paper in papers for author, pid in paper.get('author_pids', {}).items()
+                    if author not in self.author_pids}
+        self.author_pids.update(new_pids)
+        authors = {author for paper in papers for author in paper['authors']} - self.author_index.keys()
+        self.author_index.update(load_author_index(authors))
         
-        if 'is_professor' in author_cache:
-            print(" → Author already cached.")
-            continue
-        
-        profile_url = get_dblp_author_profile(author)
-        if not profile_url:
-            continue
+        for author in authors | new_pids.keys():
+            author_cache = self.author_index[author]
+            pid = self.author_pids.get(author)
+            if author in self.futures:
+                # Submitted earlier without a PID: redo it with the PID rather than trust a name search
+                if author in new_pids:
+                    self.futures[author].cancel()
+                    self.futures[author] = self.executor.submit(_process_author, author, author_cache, pid)
+            # Cached misses are retried early when a paper now gives the author's PID
+            elif _needs_lookup(author_cache) or (pid and author_cache.get('profile_url', '') is None):
+                self.futures[author] = self.executor.submit(_process_author, author, author_cache, pid)
+
+    def wait(self):
+        """Wait for all submitted lookups and save their results."""
+        logger.info("Found %d unique authors, %d to look up on DBLP.", len(self.author_index), len(self.futures))
+        try:
+            authors_by_future = {future: author for author, future in self.futures.items()}
+            for idx, future in enumerate(as_completed(authors_by_future), start=1):
+                author = authors_by_future[future]
+                author_cache = future.result()
+                if author_cache:
+                    AUTHOR_STORE.upsert(author, **author_cache)
+                logger.debug("Processed author %s (%d/%d)", author, idx, len(authors_by_future))
+                if idx % AUTHOR_CACHE_COMMIT_INTERVAL == 0:
+                    AUTHOR_STORE.commit()
+        except BaseException:
+            self.cancel()
+            raise
+        finally:
+            self.executor.shutdown()
+            AUTHOR_STORE.commit()
+
+    def cancel(self):
+        """Drop all lookups that have not started yet, e.g. after an error or Ctrl-C."""
+        self.executor.shutdown(cancel_futures=True)
 
-        pub_count = get_dblp_publication_count(profile_url)
-        if pub_count is None:
-            continue
-        
-        affiliation = "Unknown"
-        if pub_count >= 20:
-            affiliation = get_latest_affiliation(profile_url)
-        
-        author_cache.update({
-            'profile_url': profile_url,
-            'pub_count': pub_count,
-            'affiliation': affiliation,
-            'is_professor': pub_count >= 20
-        })
-        save_cache(author_cache, author_cache_path)
-        time.sleep(random.uniform(2, 5))
+
+def process_all_authors(papers):
+    """Process unique authors and cache their publication count and affiliation."""
+    author_lookups = AuthorLookups()
+    author_lookups.submit_papers(papers)
+    author_lookups.wait()
 
 
 # ---------------------------- Stage 3: Build the Final Dictionary ----------------------------
 
-def build_professor_paper_dict(papers):
-    professor_dict = {}
-    for paper in papers:
-        for author in paper['authors']:
-            author_cache = load_cache(f"cache/authors/{author.replace(' ', '_')}.json")
-            if author_cache.get('is_professor'):
-                key = f"{author}, {author_cache.get('affiliation', 'Unknown')}"
-                if key not in professor_dict:
-                    professor_dict[key] = []
-                professor_dict[key].append((paper.get('conference', 'Unknown'), paper.get('title', 'Unknown')))
-    save_cache(professor_dict, 'professor_papers.json')
-    return professor_dict
-
-
-def build_professor_paper_count_dict(papers):
+def build_professor_dicts(papers, author_index=None, save_professor_papers=False):
     """
-    Build a dictionary of professors with their paper counts per conference.
+    Build the professor paper lists and per-conference paper counts in a single pass over the papers.
 
     Args:
         papers (List[Dict]): List of paper dictionaries with 'title', 'authors', and 'conference'.
+        author_index (Dict[str, Dict], optional): Author caches keyed by name, as returned by
+                                                  load_author_index. Loaded from disk if omitted.
+        save_professor_papers (bool): Also write the paper lists to professor_papers.json.
+                                      The counts are always written to professor_paper_counts.json.
 
     Returns:
-        Dict[str, List[str]]: Dictionary with professor name+affiliation as key,
-                              and a list of paper counts per conference as values.
+        Tuple[Dict[str, List[Tuple[str, str]]], Dict[str, List[str]]]:
+            Both keyed by professor name+affiliation; the first maps to (conference, title) pairs,
+            the second to a list of "conference, count" strings.
     """
-    professor_count_dict = {}
-    conference_author_paper_count = {}
+    if author_index is None:
+        author_index = load_author_index(author for paper in papers for author in paper.get('authors', []))
 
-    # Step 1: Count papers per author per conference
+    # Step 1: Group (conference, title) pairs by author, so each unique author is classified once
+    author_to_papers = defaultdict(list)
     for paper in papers:
         conference = paper.get('conference', 'Unknown Conference')
-        authors = paper.get('authors', [])
-        
-        for author in authors:
-            author_cache_path = f"cache/authors/{author.replace(' ', '_')}.json"
-            author_data = load_cache(author_cache_path)
-            
-            # Check if the author is a professor
-            if author_data.get('is_professor'):
-                affiliation = author_data.get('affiliation', 'Unknown Affiliation')
-                key = f"{author}, {affiliation}"
-                
-                # Initialize entry if not exists
-                if key not in conference_author_paper_count:
-                    conference_author_paper_count[key] = {}
-                
-                # Increment count for the conference
-                if conference not in conference_author_paper_count[key]:
-                    conference_author_paper_count[key][conference] = 0
-                conference_author_paper_count[key][conference] += 1
-
-    # Step 2: Format the dictionary
-    for professor, conf_counts in conference_author_paper_count.items():
-        professor_count_dict[professor] = [
-            f"{conf}, {count}" for conf, count in conf_counts.items()
-        ]
+        title = paper.get('title', 'Unknown')
+        for author in paper.get('authors', []):
+            author_to_papers[author].append((conference, title))
+
+    # Step 2: Keep the professors and count their papers per conference
+    professor_dict = {}
+    professor_count_dict = {}
+    for author, author_papers in author_to_papers.items():
+        author_data = author_index.get(author, {})
+        if not author_data.get('is_professor'):
+            continue
+        key = f"{author}, {author_data.get('affiliation', 'Unknown Affiliation')}"
+        professor_dict[key] = author_papers
+        conf_counts = Counter(conference for conference, _ in author_papers)
+        professor_count_dict[key] = [f"{conf}, {count}" for conf, count in conf_counts.items()]
     
-    # Save to JSON cache
-    save_cache(professor_count_dict, 'professor_paper_counts.json')
+    # Save to JSON
+    if save_professor_papers:
+        save_output(professor_dict, 'professor_papers.json')
+    save_output(professor_count_dict, 'professor_paper_counts.json')
     
-    return professor_count_dict
+    return professor_dict, professor_count_dict
+
+
+@functools.lru_cache(maxsize=None)
+def _format_conference_count(entry):
+    """Format a "NeurIPS2020, 3" entry as "NeurIPS(20): 3" (memoized, entries repeat across professors)."""
+    conference, count = entry.rsplit(',', 1)
+    return f"{conference[:-4]}({conference[-2:]}):{count}"
 
 
-def generate_professor_paper_count_csv(professor_paper_count_dict, output_file='professor_paper_counts.csv'):
+def generate_professor_paper_count_csv(professor_paper_count_dict, output_file='professor_paper_counts.csv',
+                                       author_index=None):
     """
     Generate a CSV file summarizing professor paper counts per conference with two-digit year format,
     handling multiple commas in affiliation, and including the author URL.
@@ -272,49 +629,60 @@ def generate_professor_paper_count_csv(professor_paper_count_dict, output_file='
         professor_paper_count_dict (Dict): Dictionary with professor name+affiliation as keys,
                                            and a list of paper counts per conference as values.
         output_file (str): Path to the output CSV file.
+        author_index (Dict[str, Dict], optional): Author caches keyed by name, as returned by
+                                                  load_author_index. Loaded from disk if omitted.
     """
-    with open(output_file, mode='w', newline='') as csvfile:
-        csv_writer = csv.writer(csvfile)
+    if author_index is None:
+        author_index = load_author_index(key.split(',', 1)[0].strip() for key in professor_paper_count_dict)
+    author_url_by_name = {name: data.get('profile_url', 'Unknown URL') for name, data in author_index.items()}
+    
+    # Header row
+    rows = [['Professor Name', 'Affiliation', 'Paper Counts', 'Author URL']]
+    
+    # Process each professor entry
+    for key, counts in professor_paper_count_dict.items():
+        # Split the key into name and affiliation (split only on the first comma)
+        parts = key.split(',', 1)
+        professor_name = parts[0].strip()
+        affiliation = parts[1].strip() if len(parts) > 1 else 'Unknown Affiliation'
         
-        # Write header row
-        csv_writer.writerow(['Professor Name', 'Affiliation', 'Paper Counts', 'Author URL'])
+        # Format the counts into the desired format with two-digit year
+        formatted_counts = "; ".join(_format_conference_count(entry) for entry in counts)
         
-        # Process each professor entry
-        for key, counts in professor_paper_count_dict.items():
-            # Split the key into name and affiliation (split only on the first comma)
-            parts = key.split(',', 1)
-            professor_name = parts[0].strip()
-            affiliation = parts[1].strip() if len(parts) > 1 else 'Unknown Affiliation'
-            
-            # Format the counts into the desired format with two-digit year
-            formatted_counts = "; ".join([
-                f"{entry.split(',')[0][:-4]}({entry.split(',')[0][-2:]}):{entry.split(',')[1]}"
-                for entry in counts
-            ])
-            
-            # Fetch author URL from the cache
-            author_cache_path = f"cache/authors/{professor_name.replace(' ', '_')}.json"
-            author_data = load_cache(author_cache_path)
-            author_url = author_data.get('profile_url', 'Unknown URL')
-            
-            # Write the row to CSV
-            csv_writer.writerow([professor_name, affiliation, formatted_counts, author_url])
+        # Fetch author URL from the cache
+        author_url = author_url_by_name.get(professor_name, 'Unknown URL')
+        
+        rows.append([professor_name, affiliation, formatted_counts, author_url])
     
-    print(f"CSV file successfully generated: {output_file}")
+    # Write all rows in one call through a large buffer instead of one small write per row
+    with open(output_file, mode='w', newline='', buffering=1024 * 1024) as csvfile:
+        csv.writer(csvfile).writerows(rows)
+    
+    logger.info("CSV file successfully generated: %s", output_file)
 
 
 
 # ---------------------------- Main Program ----------------------------
 
 def main():
-    papers = fetch_all_conference_papers()
-    process_all_authors(papers) # Uncomment for first time run
-    professor_paper_count_dict = build_professor_paper_count_dict(papers)    
+    # Per-author progress is logged at DEBUG; set LOG_LEVEL=DEBUG to see it
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+                        format="%(asctime)s %(levelname)s %(message)s")
+    # Author lookups start as soon as each conference's papers arrive, overlapping the remaining queries
+    author_lookups = AuthorLookups()
+    try:
+        papers = fetch_all_conference_papers(on_papers=author_lookups.submit_papers)
+    except BaseException:
+        # Don't leave queued lookups running (and blocking interpreter exit) after a failure
+        author_lookups.cancel()
+        raise
+    author_lookups.wait()
+    author_index = load_author_index(author for paper in papers for author in paper['authors'])
+    professor_dict, professor_paper_count_dict = build_professor_dicts(papers, author_index)
     print(json.dumps(professor_paper_count_dict, indent=4))
 
-    generate_professor_paper_count_csv(professor_paper_count_dict)
+    generate_professor_paper_count_csv(professor_paper_count_dict, author_index=author_index)
 
-    # professor_dict = build_professor_paper_dict(papers)
     # print(json.dumps(professor_dict, indent=4))
 
 